@@ -4,18 +4,31 @@ A minimal FastAPI backend for the FocusMate Chrome extension.
 Tracks productive vs unproductive activity and provides daily analysis.
 """
 
-import json
+import asyncio
+import itertools
 import os
-import random
-import threading
+import sqlite3
+import string
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 from urllib.parse import urlparse
 
+import ahocorasick
+import orjson
 from fastapi import FastAPI, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, Field
 
-app = FastAPI(title="FocusMate API", version="1.0.0")
+app = FastAPI(
+    title="FocusMate API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse
+)
 
 # Enable CORS for Chrome extensions and localhost
 app.add_middleware(
@@ -30,29 +43,103 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Thread lock for file operations
-file_lock = threading.Lock()
+# SQLite database path
+DB_FILE = "activity.db"
 
-# Data file path
+# Legacy JSON data file, imported into the database on first start
 DATA_FILE = "activity.json"
 
+# Seconds to let concurrent events accumulate before a database commit
+GROUP_COMMIT_WINDOW = 0.2
+
+# One row per (date, user, host); seconds counts all time, including neutral sites
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS activity (
+    date TEXT NOT NULL,
+    user TEXT NOT NULL,
+    host TEXT NOT NULL,
+    productive INTEGER NOT NULL DEFAULT 0,
+    unproductive INTEGER NOT NULL DEFAULT 0,
+    seconds INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (date, user, host)
+) WITHOUT ROWID
+"""
+
+UPSERT_ACTIVITY = """
+INSERT INTO activity (date, user, host, productive, unproductive, seconds)
+VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT (date, user, host) DO UPDATE SET
+    productive = productive + excluded.productive,
+    unproductive = unproductive + excluded.unproductive,
+    seconds = seconds + excluded.seconds
+"""
+
+# Database connections, opened at startup. The write connection is only used
+# by the single writer task; the read connection lives on its own thread.
+write_conn: Optional[sqlite3.Connection] = None
+read_conn: Optional[sqlite3.Connection] = None
+_db_reader: Optional[ThreadPoolExecutor] = None
+
+# Activity rows waiting for the single writer task (None stops it)
+EVENTS: Optional[asyncio.Queue] = None
+_writer_task: Optional[asyncio.Task] = None
+
+# Rows enqueued / committed so far, and an event set after each commit
+_enqueued = 0
+_committed = 0
+_commit_event: Optional[asyncio.Event] = None
+
+# Set by readers to make the writer commit without waiting out the window
+flush_now: Optional[asyncio.Event] = None
+
+# Computed /analysis/today results keyed by (date, user).
+# Only valid for the SQLite data_version they were computed at.
+ANALYSIS_CACHE_SIZE = 1024
+_analysis_cache: Dict[Tuple[str, str], Dict[str, Any]] = {}
+_analysis_cache_version: Optional[int] = None
+
 # Productive sites whitelist (education, development, learning)
-PRODUCTIVE_SITES = [
+PRODUCTIVE_SITES = (
     "coursera.org", "khanacademy.org", "udemy.com", "classroom.google.com",
     "github.com", "stackoverflow.com", "wikipedia.org", "leetcode.com",
     "geeksforgeeks.org", "towardsdatascience.com", "arxiv.org", "openai.com",
     "docs.python.org", "colab.research.google.com", "medium.com",
     "codecademy.com", "freecodecamp.org", "edx.org", "pluralsight.com",
     "lynda.com", "skillshare.com", "brilliant.org", "mit.edu", "stanford.edu"
-]
+)
 
 # Unproductive sites blacklist (social media, entertainment)
-UNPRODUCTIVE_SITES = [
+UNPRODUCTIVE_SITES = (
     "instagram.com", "facebook.com", "twitter.com", "x.com", "reddit.com",
     "netflix.com", "primevideo.com", "spotify.com", "hotstar.com",
     "youtube.com", "tiktok.com", "snapchat.com", "discord.com",
     "twitch.tv", "hulu.com", "disneyplus.com", "pinterest.com"
-]
+)
+
+# Hash sets for O(1) lookups on the registered domain
+PRODUCTIVE_SET = frozenset(PRODUCTIVE_SITES)
+UNPRODUCTIVE_SET = frozenset(UNPRODUCTIVE_SITES)
+
+
+def build_site_matcher():
+    """Compile both site lists into one Aho-Corasick automaton."""
+    automaton = ahocorasick.Automaton()
+    for site in PRODUCTIVE_SITES:
+        automaton.add_word(site, True)
+    for site in UNPRODUCTIVE_SITES:
+        automaton.add_word(site, False)
+    automaton.make_automaton()
+    return automaton
+
+
+# Multi-pattern substring matcher used when the hash lookup misses
+SITE_MATCHER = build_site_matcher()
+
+# Size of the per-URL classification caches
+CLASSIFY_CACHE_SIZE = 8192
+
+# Characters allowed in a URL scheme (RFC 3986)
+SCHEME_CHARS = frozenset(string.ascii_letters + string.digits + "+-.")
 
 # Motivational quotes pool
 MOTIVATIONAL_QUOTES = [
@@ -68,26 +155,80 @@ MOTIVATIONAL_QUOTES = [
     "Concentrate all your thoughts upon the work at hand."
 ]
 
+# Endless rotation through the quotes pool
+_quotes = itertools.cycle(MOTIVATIONAL_QUOTES)
+
+# Seconds clients may cache a /quote response
+QUOTE_MAX_AGE = 300
+
+# Cached today/yesterday strings, valid until the next local midnight
+_date_cache = {"expires": 0.0, "today": "", "yesterday": ""}
+
+
+def _refresh_date_cache() -> None:
+    """Recompute the cached date strings once the cached day has ended."""
+    now = time.time()
+    if now < _date_cache["expires"]:
+        return
+    
+    today = datetime.fromtimestamp(now)
+    next_midnight = datetime.combine(today.date() + timedelta(days=1), datetime.min.time())
+    _date_cache.update(
+        expires=next_midnight.timestamp(),
+        today=today.strftime("%Y-%m-%d"),
+        yesterday=(today - timedelta(days=1)).strftime("%Y-%m-%d")
+    )
+
 
 def today_str() -> str:
     """Get today's date as a string in YYYY-MM-DD format."""
-    return datetime.now().strftime("%Y-%m-%d")
+    _refresh_date_cache()
+    return _date_cache["today"]
 
 
 def yesterday_str() -> str:
     """Get yesterday's date as a string in YYYY-MM-DD format."""
-    yesterday = datetime.now() - timedelta(days=1)
-    return yesterday.strftime("%Y-%m-%d")
+    _refresh_date_cache()
+    return _date_cache["yesterday"]
 
 
+@lru_cache(maxsize=CLASSIFY_CACHE_SIZE)
 def get_host(url: str) -> str:
-    """Extract hostname from URL."""
+    """Extract hostname (without userinfo or port) from URL."""
+    # Fast path for the scheme://host/... URLs the extension sends. The "://"
+    # must end the scheme, not sit in a fragment (about:blank#https://...)
+    start = url.find("://")
+    if start > 0 and SCHEME_CHARS.issuperset(url[:start]):
+        start += 3
+        end = len(url)
+        for sep in "/?#":
+            pos = url.find(sep, start, end)
+            if pos != -1:
+                end = pos
+        host = url[start:end]
+        
+        at = host.rfind("@")
+        if at != -1:
+            host = host[at + 1:]
+        colon = host.rfind(":")
+        if colon != -1 and "]" not in host[colon:]:  # Keep IPv6 literals intact
+            host = host[:colon]
+        if host:
+            return host.lower()
+    
     try:
         return urlparse(url).netloc.lower()
     except Exception:
         return "unknown"
 
 
+def registered_domain(host: str) -> str:
+    """Reduce a hostname to its last two labels (e.g. www.github.com -> github.com)."""
+    parts = host.rsplit('.', 2)
+    return '.'.join(parts[-2:]) if len(parts) >= 2 else host
+
+
+@lru_cache(maxsize=CLASSIFY_CACHE_SIZE)
 def is_productive_site(url: str) -> Optional[bool]:
     """
     Classify URL as productive (True), unproductive (False), or neutral (None).
@@ -98,74 +239,281 @@ def is_productive_site(url: str) -> Optional[bool]:
     Returns:
         True if productive, False if unproductive, None if neutral
     """
-    host = get_host(url)
+    return classify_host(get_host(url))
+
+
+def classify_host(host: str) -> Optional[bool]:
+    """Classify a hostname as productive (True), unproductive (False), or neutral (None)."""
+    # Fast path: single hash lookup on the registered domain
+    domain = registered_domain(host)
+    if domain in PRODUCTIVE_SET:
+        return True
+    if domain in UNPRODUCTIVE_SET:
+        return False
     
-    # Check whitelist first (productive sites)
-    for site in PRODUCTIVE_SITES:
-        if site in host:
+    # Slow path for multi-label entries (classroom.google.com) and public
+    # suffixes like co.uk: fall back to substring matching
+    # Single pass over the host; productive matches still win
+    unproductive = False
+    for _, productive in SITE_MATCHER.iter(host):
+        if productive:
             return True
-    
-    # Check blacklist (unproductive sites)
-    for site in UNPRODUCTIVE_SITES:
-        if site in host:
-            return False
+        unproductive = True
     
     # Neither productive nor unproductive - treat as neutral
-    return None
+    return False if unproductive else None
 
 
-def load_data() -> Dict[str, Any]:
-    """Load activity data from JSON file with thread safety."""
-    with file_lock:
-        if not os.path.exists(DATA_FILE):
-            return {}
-        
-        try:
-            with open(DATA_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            return {}
+def open_db() -> sqlite3.Connection:
+    """Open the activity database in WAL mode and create the schema."""
+    db = sqlite3.connect(DB_FILE, check_same_thread=False, isolation_level=None)
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute("PRAGMA synchronous=NORMAL")
+    db.execute(SCHEMA)
+    return db
 
 
-def save_data(data: Dict[str, Any]) -> None:
-    """Save activity data to JSON file with thread safety."""
-    with file_lock:
-        try:
-            with open(DATA_FILE, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            print(f"Error saving data: {e}")
+def open_read_db() -> None:
+    """Open the read connection. Runs on the reader thread."""
+    global read_conn
+    read_conn = sqlite3.connect(DB_FILE, isolation_level=None)
+
+
+def close_read_db() -> None:
+    """Close the read connection. Runs on the reader thread."""
+    global read_conn
+    read_conn.close()
+    read_conn = None
+
+
+def make_row(
+    date: str, user: str, host: str, productive: Optional[bool], seconds: int
+) -> Tuple[str, str, str, int, int, int]:
+    """Build UPSERT_ACTIVITY parameters, splitting seconds by classification."""
+    return (
+        date,
+        user,
+        host,
+        seconds if productive is True else 0,
+        seconds if productive is False else 0,
+        seconds
+    )
+
+
+def save_activity(rows: List[Tuple[str, str, str, int, int, int]]) -> None:
+    """Add activity rows to the database in a single transaction."""
+    write_conn.execute("BEGIN")
+    try:
+        write_conn.executemany(UPSERT_ACTIVITY, rows)
+        write_conn.execute("COMMIT")
+    except Exception:
+        # A failed COMMIT (e.g. SQLITE_BUSY) leaves the transaction open
+        if write_conn.in_transaction:
+            write_conn.execute("ROLLBACK")
+        raise
+
+
+def get_user_day_data(date: str, user: str) -> Dict[str, Any]:
+    """Get a user's totals and per-site seconds for a specific date. Runs on the reader thread."""
+    rows = read_conn.execute(
+        "SELECT host, productive, unproductive, seconds FROM activity "
+        "WHERE date = ? AND user = ?",
+        (date, user)
+    ).fetchall()
+    
+    return {
+        "productive": sum(row[1] for row in rows),
+        "unproductive": sum(row[2] for row in rows),
+        "sites": Counter({row[0]: row[3] for row in rows})
+    }
+
+
+def data_version() -> int:
+    """SQLite's data_version; it changes whenever another connection commits."""
+    return read_conn.execute("PRAGMA data_version").fetchone()[0]
+
+
+def load_legacy_rows() -> List[Tuple[str, str, str, int, int, int]]:
+    """Convert the old activity.json snapshot into rows."""
+    try:
+        with open(DATA_FILE, 'rb') as f:
+            data = orjson.loads(f.read())
+    except orjson.JSONDecodeError:
+        data = {}
+    
+    # The snapshot only kept per-user totals, so re-classify each host
+    rows = []
+    for date, users in data.items():
+        for user, user_data in users.items():
+            for host, seconds in user_data["sites"].items():
+                rows.append(make_row(date, user, host, classify_host(host), seconds))
+    return rows
+
+
+def migrate_legacy_data() -> None:
+    """One-time import of activity.json. The old file is renamed to activity.json.migrated."""
+    # Take the write lock before reading so concurrent workers import only once
+    write_conn.execute("BEGIN IMMEDIATE")
+    migrated = False
+    try:
+        if os.path.exists(DATA_FILE):
+            write_conn.executemany(UPSERT_ACTIVITY, load_legacy_rows())
+            os.replace(DATA_FILE, DATA_FILE + ".migrated")
+            migrated = True
+        write_conn.execute("COMMIT")
+    except Exception:
+        if write_conn.in_transaction:
+            write_conn.execute("ROLLBACK")
+        # Restore the old file so the next start retries the import
+        if migrated:
+            os.replace(DATA_FILE + ".migrated", DATA_FILE)
+        raise
+
+
+def compute_analysis(today_data: Dict[str, Any], yesterday_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Compute a user's productivity stats for today, compared with yesterday."""
+    productive_seconds = today_data["productive"]
+    unproductive_seconds = today_data["unproductive"]
+    
+    # Convert to minutes
+    productive_minutes = productive_seconds // 60
+    unproductive_minutes = unproductive_seconds // 60
+    total_minutes = productive_minutes + unproductive_minutes
+    
+    # Calculate productivity percentage
+    if total_minutes > 0:
+        productivity_percent = round((productive_minutes / total_minutes) * 100, 1)
+    else:
+        productivity_percent = 0.0
+    
+    # Compare with yesterday
+    delta_vs_yesterday_percent = None
+    yesterday_productive = yesterday_data["productive"] // 60
+    yesterday_unproductive = yesterday_data["unproductive"] // 60
+    yesterday_total = yesterday_productive + yesterday_unproductive
+    
+    if yesterday_total > 0:
+        yesterday_percent = (yesterday_productive / yesterday_total) * 100
+        delta_vs_yesterday_percent = round(productivity_percent - yesterday_percent, 1)
+    
+    # Top 10 sites by time, only including sites with at least 1 minute
+    site_breakdown = [
+        {"host": host, "minutes": seconds // 60}
+        for host, seconds in today_data["sites"].most_common(10)
+        if seconds >= 60
+    ]
+    
+    return {
+        "productive_minutes": productive_minutes,
+        "unproductive_minutes": unproductive_minutes,
+        "productivity_percent": productivity_percent,
+        "delta_vs_yesterday_percent": delta_vs_yesterday_percent,
+        "by_site": site_breakdown
+    }
+
+
+async def _read_db(func, *args):
+    """Run a read query function on the dedicated reader thread."""
+    return await asyncio.get_running_loop().run_in_executor(_db_reader, func, *args)
+
+
+async def _wait_for_commit(target: int) -> None:
+    """Wait until the writer has committed the first `target` enqueued rows."""
+    while _committed < target:
+        event = _commit_event
+        flush_now.set()
+        await event.wait()
 
 
-def get_user_day_data(data: Dict[str, Any], date: str, user: str) -> Dict[str, Any]:
-    """Get or create user data for a specific date."""
-    if date not in data:
-        data[date] = {}
+async def _writer() -> None:
+    """Single consumer that commits queued activity rows in batches."""
+    global _committed, _commit_event
+    stop = False
+    while not stop:
+        row = await EVENTS.get()
+        if row is None:
+            break
+        
+        # Let a burst of requests land in the same transaction unless a reader is waiting
+        try:
+            await asyncio.wait_for(flush_now.wait(), GROUP_COMMIT_WINDOW)
+        except asyncio.TimeoutError:
+            pass
+        flush_now.clear()
+        
+        batch = [row]
+        while not EVENTS.empty():
+            row = EVENTS.get_nowait()
+            if row is None:
+                stop = True
+                break
+            batch.append(row)
+        
+        try:
+            await asyncio.to_thread(save_activity, batch)
+        except Exception as e:
+            print(f"Error saving activity: {e}")
+        
+        # Wake readers waiting on these rows, even if the commit failed
+        _committed += len(batch)
+        done, _commit_event = _commit_event, asyncio.Event()
+        done.set()
+
+
+@app.on_event("startup")
+async def startup():
+    """Open the database, import any JSON-era data and start the writer task."""
+    global write_conn, _db_reader, EVENTS, _writer_task, _commit_event, flush_now
+    write_conn = await asyncio.to_thread(open_db)
+    if os.path.exists(DATA_FILE):
+        await asyncio.to_thread(migrate_legacy_data)
     
-    if user not in data[date]:
-        data[date][user] = {
-            "productive": 0,
-            "unproductive": 0,
-            "sites": {}
-        }
+    _db_reader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="focusmate-reader")
+    await _read_db(open_read_db)
     
-    return data[date][user]
+    EVENTS = asyncio.Queue()
+    _commit_event = asyncio.Event()
+    flush_now = asyncio.Event()
+    _writer_task = asyncio.create_task(_writer())
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    """Let the writer commit everything queued, then close the database."""
+    global write_conn, _db_reader
+    # The sentinel is queued after every pending row, so nothing is dropped
+    EVENTS.put_nowait(None)
+    flush_now.set()
+    await _writer_task
+    
+    await _read_db(close_read_db)
+    _db_reader.shutdown()
+    _db_reader = None
+    write_conn.close()
+    write_conn = None
+
+
+class ActivityEvent(BaseModel):
+    """A single activity entry in a /activity/batch request."""
+    url: str = Field(..., description="The URL being visited")
+    duration: int = Field(..., description="Duration in seconds")
+    user: str = Field("guest", description="Username")
 
 
 @app.get("/")
 async def root():
     """Root endpoint with basic info."""
-    return {
+    return ORJSONResponse({
         "message": "FocusMate API is running!",
         "version": "1.0.0",
-        "endpoints": ["/health", "/activity", "/analysis/today"]
-    }
+        "endpoints": ["/health", "/activity", "/activity/batch", "/analysis/today", "/quote"]
+    })
 
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return {"ok": True}
+    return ORJSONResponse({"ok": True})
 
 
 @app.post("/activity")
@@ -185,46 +533,62 @@ async def log_activity(
     Returns:
         Status and productivity classification
     """
+    global _enqueued
     try:
-        # Load existing data
-        data = load_data()
-        today = today_str()
-        
-        # Get user data for today
-        user_data = get_user_day_data(data, today, user)
-        
         # Classify the URL
         productive = is_productive_site(url)
         host = get_host(url)
         
-        # Update totals based on classification
-        if productive is True:
-            user_data["productive"] += duration
-        elif productive is False:
-            user_data["unproductive"] += duration
-        # If productive is None (neutral), we don't count it in either category
-        
-        # Update per-site tracking (regardless of classification)
-        if host not in user_data["sites"]:
-            user_data["sites"][host] = 0
-        user_data["sites"][host] += duration
+        # Committed by the writer task
+        EVENTS.put_nowait(make_row(today_str(), user, host, productive, duration))
+        _enqueued += 1
         
-        # Save updated data
-        save_data(data)
-        
-        return {
+        return ORJSONResponse({
             "status": "ok",
             "productive": productive,
             "host": host,
             "duration_logged": duration
-        }
+        })
         
     except Exception as e:
-        return {
+        return ORJSONResponse({
             "status": "error",
             "message": str(e),
             "productive": None
-        }
+        })
+
+
+@app.post("/activity/batch")
+async def log_activity_batch(events: List[ActivityEvent]):
+    """
+    Log several activity entries in one request.
+    
+    Args:
+        events: Activity entries, each with url, duration and user
+        
+    Returns:
+        Status and number of entries logged
+    """
+    global _enqueued
+    try:
+        today = today_str()
+        for event in events:
+            host = get_host(event.url)
+            productive = is_productive_site(event.url)
+            EVENTS.put_nowait(make_row(today, event.user, host, productive, event.duration))
+        _enqueued += len(events)
+        
+        return ORJSONResponse({
+            "status": "ok",
+            "events_logged": len(events)
+        })
+        
+    except Exception as e:
+        return ORJSONResponse({
+            "status": "error",
+            "message": str(e),
+            "events_logged": 0
+        })
 
 
 @app.get("/analysis/today")
@@ -238,78 +602,74 @@ async def get_today_analysis(user: str = Query("guest", description="Username"))
     Returns:
         Detailed productivity analysis with comparison to yesterday
     """
+    global _analysis_cache_version
     try:
-        data = load_data()
         today = today_str()
-        yesterday = yesterday_str()
-        
-        # Get today's data
-        today_data = get_user_day_data(data, today, user)
-        productive_seconds = today_data["productive"]
-        unproductive_seconds = today_data["unproductive"]
-        
-        # Convert to minutes
-        productive_minutes = productive_seconds // 60
-        unproductive_minutes = unproductive_seconds // 60
-        total_minutes = productive_minutes + unproductive_minutes
-        
-        # Calculate productivity percentage
-        if total_minutes > 0:
-            productivity_percent = round((productive_minutes / total_minutes) * 100, 1)
-        else:
-            productivity_percent = 0.0
+        key = (today, user)
         
-        # Compare with yesterday
-        delta_vs_yesterday_percent = None
-        if yesterday in data and user in data[yesterday]:
-            yesterday_data = data[yesterday][user]
-            yesterday_productive = yesterday_data["productive"] // 60
-            yesterday_unproductive = yesterday_data["unproductive"] // 60
-            yesterday_total = yesterday_productive + yesterday_unproductive
-            
-            if yesterday_total > 0:
-                yesterday_percent = (yesterday_productive / yesterday_total) * 100
-                delta_vs_yesterday_percent = round(productivity_percent - yesterday_percent, 1)
+        # Make activity this worker has already accepted visible to the queries
+        await _wait_for_commit(_enqueued)
         
-        # Prepare site breakdown (top sites by time)
-        site_breakdown = []
-        for host, seconds in today_data["sites"].items():
-            minutes = seconds // 60
-            if minutes > 0:  # Only include sites with at least 1 minute
-                site_breakdown.append({
-                    "host": host,
-                    "minutes": minutes
-                })
+        # Any commit, from this or another worker, invalidates every cached analysis
+        version = await _read_db(data_version)
+        if version != _analysis_cache_version:
+            _analysis_cache.clear()
+            _analysis_cache_version = version
         
-        # Sort by minutes descending
-        site_breakdown.sort(key=lambda x: x["minutes"], reverse=True)
+        # Reuse the last computed analysis until new activity is committed
+        analysis = _analysis_cache.get(key)
+        if analysis is None:
+            today_data = await _read_db(get_user_day_data, today, user)
+            yesterday_data = await _read_db(get_user_day_data, yesterday_str(), user)
+            analysis = compute_analysis(today_data, yesterday_data)
+            # Another request may have moved the cache to a newer version while
+            # we were reading; only cache results read at the current version
+            if _analysis_cache_version == version:
+                if len(_analysis_cache) >= ANALYSIS_CACHE_SIZE:
+                    _analysis_cache.clear()
+                _analysis_cache[key] = analysis
         
-        # Get random motivational quote
-        quote = random.choice(MOTIVATIONAL_QUOTES)
-        
-        return {
-            "productive_minutes": productive_minutes,
-            "unproductive_minutes": unproductive_minutes,
-            "productivity_percent": productivity_percent,
-            "delta_vs_yesterday_percent": delta_vs_yesterday_percent,
-            "quote": quote,
-            "by_site": site_breakdown[:10]  # Top 10 sites
-        }
+        return ORJSONResponse(analysis)
         
     except Exception as e:
-        return {
+        return ORJSONResponse({
             "productive_minutes": 0,
             "unproductive_minutes": 0,
             "productivity_percent": 0.0,
             "delta_vs_yesterday_percent": None,
-            "quote": "Every journey begins with a single step.",
             "by_site": [],
             "error": str(e)
-        }
+        })
+
+
+@app.get("/quote")
+async def get_quote():
+    """
+    Get a motivational quote.
+    
+    Returns:
+        The next quote in the rotation, cacheable by the client for QUOTE_MAX_AGE seconds
+    """
+    return ORJSONResponse(
+        {"quote": next(_quotes)},
+        headers={"Cache-Control": f"public, max-age={QUOTE_MAX_AGE}"}
+    )
 
 
 if __name__ == "__main__":
     import uvicorn
+    # Writes are acknowledged before they are committed, and /analysis/today
+    # only waits for rows queued in its own worker. With several workers an
+    # analysis can miss a batch the extension just sent, so default to one;
+    # FOCUSMATE_WORKERS overrides it.
+    workers = int(os.environ.get("FOCUSMATE_WORKERS", "1"))
     print("Starting FocusMate API server...")
-    print("Run with: uvicorn main:app --reload --port 8000")
-    uvicorn.run("main:app", host="127.0.0.1", port=8000, reload=True)
+    print("For development run: uvicorn main:app --reload --port 8000")
+    uvicorn.run(
+        "main:app",
+        host="127.0.0.1",
+        port=8000,
+        workers=workers,
+        access_log=False,
+        log_level="warning"
+    )
@@ -21,6 +21,22 @@ let timerState = {
 // Backend URL
 const BACKEND_URL = 'http://127.0.0.1:8000';
 
+// Activity entries waiting to be sent to the backend in one batch
+// (mirrored to chrome.storage.session so they survive worker restarts)
+let activityBuffer = [];
+
+// Number of buffered entries that triggers a batch upload
+const ACTIVITY_BATCH_SIZE = 5;
+
+// Oldest entries are dropped beyond this while the backend is unreachable
+const MAX_BUFFERED_ACTIVITY = 500;
+
+// Upload currently in flight, if any
+let activityUpload = null;
+
+// Entries taken out of the buffer by the upload in flight
+let uploadingActivity = [];
+
 /**
  * Initialize service worker
  */
@@ -95,7 +111,12 @@ chrome.runtime.onMessage.addListener((message, sender, sendResponse) => {
             break;
         case 'STOP_TIMER':
             stopTimer();
-            break;
+            // Send buffered activity before the popup fetches the analysis
+            flushActivityBuffer().finally(() => {
+                sendStateToPopup();
+                sendResponse({ success: true });
+            });
+            return true;
         case 'GET_STATE':
             sendResponse(getPublicState());
             return;
@@ -171,6 +192,7 @@ function resetTimer() {
     timerState.isPaused = false;
     timerState.currentCycle = 0;
     
+    flushActivityBuffer();
     saveStateToStorage();
 }
 
@@ -239,6 +261,9 @@ function handleTimerComplete() {
         timerState.timeLeft = timerState.breakDuration;
         timerState.currentCycle++;
         
+        // Send the rest of this work period's activity
+        flushActivityBuffer();
+        
         // Show notification
         showNotification('Work period completed!', 'Time for a break. You earned it! 🎉');
         
@@ -283,27 +308,17 @@ async function logActiveTab() {
         
         console.log('Logging URL:', tab.url);
         
-        // Send to backend
-        const url = `${BACKEND_URL}/activity?url=${encodeURIComponent(tab.url)}&duration=${timerState.logInterval}&user=${encodeURIComponent(timerState.username)}`;
+        // Buffer the entry; sent to the backend in batches
+        await activityBufferLoaded;
+        activityBuffer.push({
+            url: tab.url,
+            duration: timerState.logInterval,
+            user: timerState.username
+        });
+        await saveActivityBuffer();
         
-        try {
-            const response = await fetch(url, {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json'
-                }
-            });
-            
-            if (!response.ok) {
-                throw new Error(`HTTP ${response.status}: ${response.statusText}`);
-            }
-            
-            const result = await response.json();
-            console.log('Activity logged:', result);
-            
-        } catch (fetchError) {
-            console.error('Error sending activity to backend:', fetchError);
-            // Don't break the timer if backend is unavailable
+        if (activityBuffer.length >= ACTIVITY_BATCH_SIZE) {
+            await flushActivityBuffer();
         }
         
     } catch (error) {
@@ -311,6 +326,92 @@ async function logActiveTab() {
     }
 }
 
+/**
+ * Load buffered activity left over from a previous service worker instance
+ */
+async function loadActivityBuffer() {
+    try {
+        const result = await chrome.storage.session.get(['activityBuffer']);
+        if (result.activityBuffer) {
+            activityBuffer = [...result.activityBuffer, ...activityBuffer];
+        }
+    } catch (error) {
+        console.error('Error loading activity buffer:', error);
+    }
+}
+
+/**
+ * Save buffered activity, including any upload in flight, to session storage
+ */
+async function saveActivityBuffer() {
+    try {
+        await chrome.storage.session.set({
+            activityBuffer: [...uploadingActivity, ...activityBuffer]
+        });
+    } catch (error) {
+        console.error('Error saving activity buffer:', error);
+    }
+}
+
+/**
+ * Send all buffered activity entries to the backend in one request
+ */
+async function flushActivityBuffer() {
+    await activityBufferLoaded;
+    
+    // Wait for an upload already in flight so no entry is sent twice
+    while (activityUpload) {
+        await activityUpload;
+    }
+    
+    if (activityBuffer.length === 0) {
+        return;
+    }
+    
+    activityUpload = uploadActivityBuffer();
+    try {
+        await activityUpload;
+    } finally {
+        activityUpload = null;
+    }
+}
+
+/**
+ * Upload the current buffer; entries are put back if the request fails
+ */
+async function uploadActivityBuffer() {
+    // Storage keeps these entries until the upload succeeds, so they are
+    // not lost if the worker is stopped mid-request
+    const events = activityBuffer;
+    activityBuffer = [];
+    uploadingActivity = events;
+    
+    try {
+        const response = await fetch(`${BACKEND_URL}/activity/batch`, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json'
+            },
+            body: JSON.stringify(events)
+        });
+        
+        if (!response.ok) {
+            throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+        }
+        
+        const result = await response.json();
+        console.log('Activity batch logged:', result);
+        
+    } catch (fetchError) {
+        console.error('Error sending activity to backend:', fetchError);
+        // Don't break the timer if backend is unavailable; retry with the next batch
+        activityBuffer = [...events, ...activityBuffer].slice(-MAX_BUFFERED_ACTIVITY);
+    }
+    
+    uploadingActivity = [];
+    await saveActivityBuffer();
+}
+
 /**
  * Show notification to user
  */
@@ -362,6 +463,7 @@ function getPublicState() {
  */
 chrome.runtime.onSuspend.addListener(() => {
     console.log('Extension suspending, saving state');
+    // Buffered activity is already in session storage and is sent after restart
     saveStateToStorage();
     
     if (timerState.intervalId) {
@@ -371,3 +473,4 @@ chrome.runtime.onSuspend.addListener(() => {
 
 // Initialize on load
 loadStateFromStorage();
+const activityBufferLoaded = loadActivityBuffer();
@@ -182,12 +182,35 @@ async function handleFinish() {
         const analysis = await response.json();
         displayAnalysis(analysis);
         
+        // The quote is served separately so the browser can cache it
+        await fetchQuote();
+        
     } catch (error) {
         console.error('Error fetching analysis:', error);
         showErrorMessage('Failed to fetch analysis. Make sure the backend is running.');
     }
 }
 
+/**
+ * Fetch a motivational quote and show it in the analysis section
+ */
+async function fetchQuote() {
+    try {
+        const response = await fetch('http://127.0.0.1:8000/quote');
+        
+        if (!response.ok) {
+            throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+        }
+        
+        const result = await response.json();
+        elements.motivationalQuote.textContent = result.quote;
+        
+    } catch (error) {
+        // Keep the current quote if the backend doesn't provide one
+        console.error('Error fetching quote:', error);
+    }
+}
+
 /**
  * Display analysis results in the UI
  */
@@ -207,9 +230,6 @@ function displayAnalysis(analysis) {
         elements.deltaPercent.style.color = '#7f8c8d';
     }
     
-    // Update quote
-    elements.motivationalQuote.textContent = analysis.quote;
-    
     // Update sites list
     elements.sitesList.innerHTML = '';
     if (analysis.by_site && analysis.by_site.length > 0) {